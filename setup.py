@@ -8,6 +8,9 @@ setup(
         "websockets>=10.0",
         "asyncio",
     ],
+    extras_require={
+        "uvloop": ["uvloop>=0.18"],
+    },
     tests_require=[
         "pytest",
     ],
@@ -1,7 +1,326 @@
 import asyncio
+import collections
 import logging
+import socket
 import websockets
-from asyncio import StreamReader, StreamWriter
+from asyncio import StreamWriter
+
+_log = logging.getLogger(__name__)
+
+# The legacy websockets implementation (websockets.serve before version 14) has a few extra settings
+_LEGACY_WEBSOCKETS = websockets.serve.__module__.startswith('websockets.legacy')
+
+# The default delimiter of TCP frames, shared by every connection and message
+_CRLF = b'\r\n'
+
+# Maximum number of queued WebSocket messages coalesced into one TCP write
+_WS_WRITE_BATCH = 128
+
+# Initial size of the TCP receive buffer, it grows once reads fill it
+_INITIAL_READ_BUFFER = 4096
+
+class _FrameBuffer:
+    """
+    A receive buffer that splits TCP data into delimited frames.
+
+    Data is written into the free tail of the buffer and every byte is scanned for the delimiter only once,
+    the search resuming where the previous one stopped. Consumed frames are dropped by moving the read
+    index; the buffer is only compacted, grown or cleared when its tail is full. It starts small and grows
+    up to compact_size as reads fill it, so idle connections do not hold a full-size buffer.
+
+    Attributes:
+        limit (int): The size of the largest frame that is kept, larger frames are discarded.
+        delimiter (bytes): The delimiter that terminates frames.
+        compact_size (int): The buffer size from which a full buffer is compacted rather than grown.
+        _data (bytearray): The buffer holding the received data.
+        _view (memoryview): A view of _data used for slicing without copies.
+        _start (int): The index of the first byte of the current frame.
+        _end (int): The index after the last received byte.
+        _scan (int): The index at which the next delimiter search starts.
+        _discarding (bool): Whether the current frame exceeds the limit and is being dropped.
+    """
+
+    def __init__(self, size, limit, delimiter=_CRLF, compact_size=None):
+        """
+        Initializes the buffer.
+
+        Args:
+            size (int): The initial size of the buffer, it grows up to the frame limit when needed.
+            limit (int): The size of the largest frame that is kept.
+            delimiter (bytes): The delimiter that terminates frames. Default is b'\\r\\n'.
+            compact_size (int): The buffer size from which a full buffer is compacted rather than grown.
+                Default is None (the initial size).
+        """
+        self.limit = limit
+        self.delimiter = delimiter
+        self.compact_size = size if compact_size is None else compact_size
+        self._data = bytearray(size)
+        self._view = memoryview(self._data)
+        self._start = 0
+        self._end = 0
+        self._scan = 0
+        self._discarding = False
+
+    def tail(self):
+        """
+        Returns the free part of the buffer that new data should be written into.
+
+        Returns:
+            memoryview: A writable, non-empty view after the received data.
+        """
+        if self._end == len(self._data):
+            max_size = self.limit + len(self.delimiter)
+            growable = len(self._data) < max_size
+            if self._start and (len(self._data) >= self.compact_size or not growable):
+                # Move the unterminated frame to the front
+                size = self._end - self._start
+                self._view[:size] = self._view[self._start:self._end]
+                self._scan -= self._start
+                self._start, self._end = 0, size
+            elif growable:
+                self._grow(min(len(self._data) * 2, max_size))
+            else:
+                self._discard()
+        return self._view[self._end:]
+
+    def advance(self, n):
+        """
+        Marks bytes written into the tail as received and splits off the completed frames.
+
+        Args:
+            n (int): The number of bytes written into the tail.
+
+        Returns:
+            list[bytes]: The completed frames, without delimiters.
+        """
+        # The scan runs once per frame, so it works on locals instead of attributes
+        end = self._end = self._end + n
+        start, scan = self._start, self._scan
+        find, view, limit = self._data.find, self._view, self.limit
+        delimiter = self.delimiter
+        size = len(delimiter)
+        frames = []
+        append = frames.append
+        while True:
+            index = find(delimiter, scan, end)
+            if index == -1:
+                # A delimiter may straddle the next read
+                scan = max(start, end - size + 1)
+                break
+
+            if self._discarding or index - start > limit:
+                if not self._discarding:
+                    _log.warning("TCP frame exceeds the frame limit, discarding it")
+                self._discarding = False
+            else:
+                append(bytes(view[start:index]))
+            start = scan = index + size
+
+        if start == end:
+            start = scan = self._end = 0
+        self._start, self._scan = start, scan
+        return frames
+
+    def remainder(self):
+        """
+        Takes the unterminated data left in the buffer once the connection is closed.
+
+        Returns:
+            bytes: The unterminated data, empty if there is none or it belongs to a discarded frame.
+        """
+        remainder = b''
+        if not self._discarding and self._end - self._start <= self.limit:
+            remainder = bytes(self._view[self._start:self._end])
+        self._start = self._end = self._scan = 0
+        self._discarding = False
+        return remainder
+
+    def empty(self):
+        """
+        Returns whether the buffer holds no unterminated data.
+
+        Returns:
+            bool: True if every received byte belongs to a frame that has been split off.
+        """
+        return self._start == self._end and not self._discarding
+
+    def _grow(self, size):
+        """
+        Replaces the buffer with a larger one holding the same data.
+
+        Args:
+            size (int): The new size of the buffer.
+        """
+        data = bytearray(size)
+        data[:self._end] = self._view[:self._end]
+        self._view.release()
+        self._data = data
+        self._view = memoryview(data)
+
+    def _discard(self):
+        """
+        Drops a frame that filled the buffer without a delimiter.
+
+        The last bytes are kept, since they may be the start of the delimiter.
+        """
+        if not self._discarding:
+            _log.warning("TCP frame exceeds the frame limit, discarding it")
+            self._discarding = True
+        keep = len(self.delimiter) - 1
+        self._view[:keep] = self._view[self._end - keep:self._end]
+        self._start, self._end, self._scan = 0, keep, 0
+
+
+class _TCPReaderProtocol(asyncio.BufferedProtocol):
+    """
+    A protocol that receives TCP data straight into a _FrameBuffer.
+
+    The transport reads into the free tail of the frame buffer through get_buffer(), so received data is
+    copied once and no bytes object is created per read. The protocol also implements the write flow control
+    that StreamWriter.drain() relies on, so the same connection is written through a regular StreamWriter.
+    asyncio's FlowControlMixin is not used because it derives from asyncio.Protocol, and event loops such
+    as uvloop then deliver data through data_received() instead of get_buffer().
+
+    Attributes:
+        frames (_FrameBuffer): The buffer that received data is written into.
+        _read_size (int): The largest amount of data handed to the transport per read.
+        _pending (list[bytes]): Completed frames that have not been taken yet.
+        _pending_bytes (int): The total size of the pending frames.
+        _high_water (int): The pending size above which reading is paused.
+        _reading_paused (bool): Whether reading is paused because too many frames are pending.
+        _writing_paused (bool): Whether the transport asked to stop writing until its buffer drains.
+        _eof (bool): Whether the peer closed its side of the connection.
+        _connection_lost (bool): Whether the connection is lost.
+        _waiter (asyncio.Future): The future read_frames() waits on for new frames, if any.
+        _drain_waiters (collections.deque): The futures drain() calls wait on while writing is paused.
+        _closed (asyncio.Future): The future completed once the connection is lost.
+    """
+
+    def __init__(self, frames, read_size, high_water, loop):
+        """
+        Initializes the protocol.
+
+        Args:
+            frames (_FrameBuffer): The buffer that received data is written into.
+            read_size (int): The largest amount of data handed to the transport per read.
+            high_water (int): The pending size above which reading is paused.
+            loop (asyncio.AbstractEventLoop): The event loop the connection runs on.
+        """
+        self._loop = loop
+        self.frames = frames
+        self._read_size = read_size
+        self._high_water = high_water
+        self._transport = None
+        self._pending = []
+        self._pending_bytes = 0
+        self._reading_paused = False
+        self._writing_paused = False
+        self._eof = False
+        self._connection_lost = False
+        self._waiter = None
+        self._drain_waiters = collections.deque()
+        self._closed = loop.create_future()
+
+    def connection_made(self, transport):
+        self._transport = transport
+
+    def get_buffer(self, sizehint):
+        return self.frames.tail()[:self._read_size]
+
+    def buffer_updated(self, nbytes):
+        frames = self.frames.advance(nbytes)
+        if frames:
+            self._pending += frames
+            self._pending_bytes += sum(map(len, frames))
+            # Stop reading while the WebSocket side lags behind, like StreamReader does
+            if self._pending_bytes > self._high_water and not self._reading_paused:
+                self._reading_paused = True
+                self._transport.pause_reading()
+            self._wakeup()
+
+    def eof_received(self):
+        self._eof = True
+        self._wakeup()
+        return True  # Keep the transport open so WS to TCP forwarding can continue
+
+    def connection_lost(self, exc):
+        self._connection_lost = True
+        self._eof = True
+        self._wakeup()
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                if exc is None:
+                    waiter.set_result(None)
+                else:
+                    waiter.set_exception(exc)
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self):
+        self._writing_paused = True
+
+    def resume_writing(self):
+        self._writing_paused = False
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _drain_helper(self):
+        # Called by StreamWriter.drain(), mirrors asyncio.streams.FlowControlMixin
+        if self._connection_lost:
+            raise ConnectionResetError('Connection lost')
+        if not self._writing_paused:
+            return
+        waiter = self._loop.create_future()
+        self._drain_waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            self._drain_waiters.remove(waiter)
+
+    def _get_close_waiter(self, stream):
+        return self._closed
+
+    def is_idle(self):
+        """
+        Returns whether the connection is open and holds no received data, so a new session can use it.
+
+        Returns:
+            bool: True if the connection can be reused.
+        """
+        return (not self._eof and not self._pending and self.frames.empty()
+                and not self._transport.is_closing())
+
+    def _wakeup(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def read_frames(self):
+        """
+        Waits for completed frames and takes them.
+
+        Once the peer has closed the connection, unterminated trailing data is returned as a last frame.
+
+        Returns:
+            list[bytes]: The completed frames, or an empty list once everything has been read.
+        """
+        while not self._pending and not self._eof:
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        frames, self._pending, self._pending_bytes = self._pending, [], 0
+        if self._reading_paused and not self._eof:
+            self._reading_paused = False
+            self._transport.resume_reading()
+        if self._eof:
+            remainder = self.frames.remainder()
+            if remainder:
+                frames.append(remainder)
+        return frames
+
 
 class TCPWebSocketAdapter:
     """
@@ -15,12 +334,30 @@ class TCPWebSocketAdapter:
         tcp_port (int): The port number of the TCP server.
         ws_host (str): The host address for the WebSocket server (default is 'localhost').
         ws_port (int): The port number for the WebSocket server (default is 5050).
-        buffer_size (int): The size of the buffer used to read data from the TCP connection.
+        tcp_read_size (int): The largest single read from the TCP connection; the receive buffer grows up to twice
+            this value as reads fill it and the largest single frame is 64 times this value.
+        ws_read_size (int): The read limit of the WebSocket connections, or None for the library default.
+        queue_maxsize (int): The number of WebSocket messages queued for the TCP connection per client.
+        write_high_water (int): The write buffer size above which writers wait for it to drain, or None.
+        write_low_water (int): The write buffer size writers wait for once it was above the high-water mark, or None.
+        tcp_pool_size (int): The number of idle TCP connections kept for reuse, 0 disables the pool.
+        delimiter (bytes): The delimiter that terminates frames on the TCP connection.
+        batch_messages (bool): Whether TCP frames that are already buffered are sent as one WebSocket message.
+        batch_max_messages (int): The maximum number of TCP frames combined into one WebSocket message.
+        batch_max_bytes (int): The maximum payload size of a batch.
+        tcp_rcvbuf (int): The minimum kernel receive buffer size of the adapter's sockets, or None.
+        tcp_sndbuf (int): The minimum kernel send buffer size of the adapter's sockets, or None.
+        tcp_nodelay (bool): Whether Nagle's algorithm is disabled on the adapter's sockets.
+        tcp_quickack (bool): Whether TCP_QUICKACK is set on the adapter's sockets once they connect (Linux only).
         _ws_server (websockets.serve): The WebSocket server instance.
         _ws_server_runner_task (asyncio.Task): The task for running the WebSocket server.
     """
 
-    def __init__(self, tcp_host, tcp_port, ws_host='localhost', ws_port=5050, buffer_size=1024):
+    def __init__(self, tcp_host, tcp_port, ws_host='localhost', ws_port=5050, buffer_size=None,
+                 batch_messages=False, batch_max_messages=128, batch_max_bytes=65536,
+                 tcp_rcvbuf=None, tcp_sndbuf=None, tcp_nodelay=True, tcp_quickack=False,
+                 tcp_read_size=65536, ws_read_size=None, queue_maxsize=1024,
+                 write_high_water=None, write_low_water=None, tcp_pool_size=0, delimiter=_CRLF):
         """
         Initializes the TCPWebSocketAdapter with the specified parameters.
 
@@ -29,15 +366,92 @@ class TCPWebSocketAdapter:
             tcp_port (int): The port number of the TCP server.
             ws_host (str): The host address for the WebSocket server. Default is 'localhost'.
             ws_port (int): The port number for the WebSocket server. Default is 5050.
-            buffer_size (int): The size of the buffer for reading data from the TCP connection. Default is 1024.
+            buffer_size (int): Deprecated alias of tcp_read_size, it takes precedence when given. Default is None.
+            batch_messages (bool): If True, TCP frames that have already arrived are joined with b'\\n' and sent
+                as a single WebSocket message. Frames containing b'\\n' cannot be told apart after joining, so
+                leave this disabled unless the payloads never contain it. Default is False.
+            batch_max_messages (int): The maximum number of TCP frames in one batch. Default is 128.
+            batch_max_bytes (int): The maximum payload size of a batch, not counting separators. A frame that
+                would exceed it starts the next batch; a single frame larger than this is sent on its own.
+                Default is 65536.
+            tcp_rcvbuf (int): The SO_RCVBUF size applied to the TCP and WebSocket sockets. It is only ever raised,
+                never lowered. Setting it turns off Linux receive buffer autotuning. Default is None (kernel default).
+            tcp_sndbuf (int): The SO_SNDBUF size applied the same way as tcp_rcvbuf. Default is None.
+            tcp_nodelay (bool): If True, Nagle's algorithm is disabled so small frames are not delayed. Default is True.
+            tcp_quickack (bool): If True, TCP_QUICKACK is set where the platform supports it. Linux clears the flag
+                again on its own, so it is not a persistent setting: it only speeds up the ACKs right after the
+                socket connects, the kernel's delayed ACK heuristics apply after that. Default is False.
+            tcp_read_size (int): The largest single read from the TCP connection. The receive buffer starts at 4 KiB
+                and grows up to twice this value as reads fill it, frames up to 64 times this value are accepted. Reads never return more than the
+                kernel receive buffer holds, so there is no point in making it larger than tcp_rcvbuf.
+                Default is 65536.
+            ws_read_size (int): The read limit of the WebSocket connections. Only the legacy websockets
+                implementation has this setting, it is ignored with a warning otherwise. Default is None.
+            queue_maxsize (int): The number of WebSocket messages that may wait for the TCP connection per client.
+                When the queue is full, the adapter stops reading from that WebSocket until the TCP side catches up.
+                Default is 1024.
+            write_high_water (int): The high-water mark of the user-space write buffers of the TCP connection and
+                the WebSocket connections. Writers wait in drain() once more than this is buffered. Data only
+                builds up here after the kernel send buffer (see tcp_sndbuf) is full, so the two add up.
+                Default is None (64 KiB for TCP, the websockets default for WebSocket).
+            write_low_water (int): The size the write buffers must drain to before writers resume. If only this is
+                set, the high-water mark is four times it, like asyncio does. With the legacy websockets
+                implementation, the WebSocket side always uses a quarter of the high-water mark.
+                Default is None (a quarter of the high-water mark).
+            tcp_pool_size (int): The number of idle TCP connections kept open after their WebSocket client
+                disconnects, so the next client reuses one instead of connecting again. A connection is only
+                kept if the TCP server has not closed it and sent nothing after the session. Only enable this
+                if the TCP server accepts a new session on a connection that a previous one used. Default is 0.
+            delimiter (bytes): The delimiter that terminates frames on the TCP connection, for example b'\\x01'
+                or b'\\x00' for protocols that do not use line endings. It is stripped from frames sent to
+                WebSocket clients and appended to messages sent to the TCP server. Default is b'\\r\\n'.
+
+        Raises:
+            TypeError: If delimiter is not bytes.
+            ValueError: If delimiter is empty, or the write water marks are negative or low above high.
         """
+        if not isinstance(delimiter, bytes):
+            raise TypeError("delimiter must be bytes, not %s" % type(delimiter).__name__)
+        if not delimiter:
+            raise ValueError("delimiter must not be empty")
+        if write_high_water is not None and write_high_water < 0:
+            raise ValueError("write_high_water must not be negative")
+        if write_low_water is not None and write_low_water < 0:
+            raise ValueError("write_low_water must not be negative")
+        if write_high_water is not None and write_low_water is not None and write_high_water < write_low_water:
+            raise ValueError("write_high_water must not be less than write_low_water")
         self.tcp_host = tcp_host
         self.tcp_port = tcp_port
         self.ws_host = ws_host
         self.ws_port = ws_port
-        self.buffer_size = buffer_size
+        self.batch_messages = batch_messages
+        self.batch_max_messages = batch_max_messages
+        self.batch_max_bytes = batch_max_bytes
+        self.tcp_rcvbuf = tcp_rcvbuf
+        self.tcp_sndbuf = tcp_sndbuf
+        self.tcp_nodelay = tcp_nodelay
+        self.tcp_quickack = tcp_quickack
+        self.tcp_read_size = tcp_read_size if buffer_size is None else buffer_size
+        self.ws_read_size = ws_read_size
+        self.queue_maxsize = queue_maxsize
+        self.write_high_water = write_high_water
+        self.write_low_water = write_low_water
+        self.tcp_pool_size = tcp_pool_size
+        self.delimiter = delimiter
+        # The largest frame kept by the receive buffer, larger ones are discarded
+        self._frame_limit = self.tcp_read_size * 64
+        # Frames waiting for the WebSocket side may use this much memory before TCP reading is paused
+        self._pending_limit = max(256 * 1024, self.tcp_read_size * 4)
         self._ws_server = None
         self._ws_server_runner_task = None
+        self._pool = None
+
+    @property
+    def buffer_size(self):
+        """
+        int: Alias of tcp_read_size, kept for backward compatibility.
+        """
+        return self.tcp_read_size
 
     @staticmethod
     def setup_logging(level=logging.INFO):
@@ -51,60 +465,235 @@ class TCPWebSocketAdapter:
         """
         logging.basicConfig(level=level, format="%(asctime)s - %(levelname)s - %(message)s")
 
-    async def _forward_tcp_to_ws(self, reader: StreamReader, websocket):
+    async def _forward_tcp_to_ws(self, reader: _TCPReaderProtocol, websocket):
         """
         Reads data from the TCP connection and forwards it to the WebSocket client.
 
         Args:
-            reader (StreamReader): The reader used to read data from the TCP connection.
+            reader (_TCPReaderProtocol): The protocol receiving data from the TCP connection.
             websocket (websockets.WebSocketClientProtocol): The WebSocket connection to forward the data to.
         """
-        buffer = bytearray()
         try:
-            logging.info(f"Started forwarding from TCP {self.tcp_host}:{self.tcp_port} to WS {self.ws_host}:{self.ws_port}")
+            _log.debug("Started forwarding from TCP %s:%s to WS %s:%s", self.tcp_host, self.tcp_port, self.ws_host, self.ws_port)
             while True:
-                data = await reader.read(self.buffer_size)
-                if not data:
-                    logging.info("TCP connection closed by peer")
+                frames = await reader.read_frames()
+                if not frames:
+                    _log.info("TCP connection closed by peer")
                     break
 
-                buffer.extend(data)
-                while b'\r\n' in buffer:
-                    message, _, buffer = buffer.partition(b'\r\n')
-                    logging.info(f"TCP -> WS: {message!r}")
-                    try:
-                        await websocket.send(message)
-                    except websockets.exceptions.ConnectionClosed:
-                        logging.warning("WebSocket client disconnected during forwarding")
-                        break  # Stop forwarding if WebSocket is closed
+                if not await self._send_frames(websocket, frames):
+                    break  # Stop forwarding if WebSocket is closed
 
-        except (asyncio.CancelledError, websockets.exceptions.ConnectionClosed):
-            logging.warning("Error during TCP to WebSocket forwarding")
+        except asyncio.CancelledError:
+            _log.info("TCP to WebSocket forwarding stopped")
+        except websockets.exceptions.ConnectionClosed:
+            _log.warning("Error during TCP to WebSocket forwarding")
         finally:
-            logging.info("TCP connection handler exited")
+            _log.info("TCP connection handler exited")
 
-    async def _forward_ws_to_tcp(self, websocket, writer: StreamWriter):
+    async def _send_frames(self, websocket, frames):
         """
-        Reads data from the WebSocket client and forwards it to the TCP connection.
+        Sends TCP frames to the WebSocket client, batching them if enabled.
+
+        Args:
+            websocket (websockets.WebSocketClientProtocol): The WebSocket connection to send the frames to.
+            frames (list[bytes]): The frames to send, without delimiters.
+
+        Returns:
+            bool: False if the WebSocket client disconnected, True otherwise.
+        """
+        send = websocket.send
+        log_enabled = _log.isEnabledFor
+        for message in self._batch_frames(frames):
+            if log_enabled(logging.INFO):
+                _log.info("TCP -> WS: %r", message)
+            try:
+                await send(message)
+            except websockets.exceptions.ConnectionClosed:
+                _log.warning("WebSocket client disconnected during forwarding")
+                return False
+        return True
+
+    def _batch_frames(self, frames):
+        """
+        Groups TCP frames into WebSocket messages according to the batching settings.
+
+        Args:
+            frames (list[bytes]): The frames to group.
+
+        Returns:
+            list[bytes]: One message per frame, or frames joined with b'\\n' if batching is enabled.
+        """
+        if not self.batch_messages or len(frames) < 2:
+            return frames
+
+        messages = []
+        batch = []
+        batch_bytes = 0
+        for frame in frames:
+            if batch and (len(batch) == self.batch_max_messages or batch_bytes + len(frame) > self.batch_max_bytes):
+                messages.append(b'\n'.join(batch))
+                batch = []
+                batch_bytes = 0
+            batch.append(frame)
+            batch_bytes += len(frame)
+        messages.append(b'\n'.join(batch))
+        return messages
+
+    async def _forward_ws_to_tcp(self, websocket, queue):
+        """
+        Reads data from the WebSocket client and queues it for the TCP connection.
+
+        This runs in the connection handler itself, not in a task of its own. Messages are handed to the
+        _write_to_tcp() task through a bounded queue, so that messages arriving while a write is in progress
+        go out together in the next one.
 
         Args:
             websocket (websockets.WebSocketClientProtocol): The WebSocket connection to read data from.
-            writer (StreamWriter): The writer used to write data to the TCP connection.
+            queue (asyncio.Queue): The queue of encoded messages for the TCP connection.
+
+        Returns:
+            bool: True if the client closed the connection normally, so the queued messages should be flushed.
         """
         try:
-            logging.info(f"Started forwarding from WS {self.ws_host}:{self.ws_port} to TCP {self.tcp_host}:{self.tcp_port}")
+            _log.debug("Started forwarding from WS %s:%s to TCP %s:%s", self.ws_host, self.ws_port, self.tcp_host, self.tcp_port)
+            # Bound once, these are looked up for every message otherwise
+            put = queue.put
+            log_enabled = _log.isEnabledFor
             async for message in websocket:
                 if isinstance(message, str):
                     message = message.encode()
-                logging.info(f"WS -> TCP: {message!r}")
-                writer.write(message + b'\r\n')
-                await writer.drain()
-        except (asyncio.CancelledError, websockets.exceptions.ConnectionClosed):
-            logging.warning("Error during WebSocket to TCP forwarding")
-        finally:
-            logging.info("WebSocket connection handler exited")
-            writer.close()
+                if log_enabled(logging.INFO):
+                    _log.info("WS -> TCP: %r", message)
+                await put(message)  # Waits while the queue is full, which stops reading from the WebSocket
+            return True
+        except asyncio.CancelledError:
+            _log.info("WebSocket to TCP forwarding stopped")
+        except websockets.exceptions.ConnectionClosed:
+            _log.warning("Error during WebSocket to TCP forwarding")
+        return False
+
+    @staticmethod
+    async def _write_to_tcp(writer: StreamWriter, queue, delimiter):
+        """
+        Writes queued WebSocket messages to the TCP connection until None is queued.
+
+        All messages already in the queue, up to a batch limit, are written with one writelines() call.
+        drain() is only awaited while the transport buffers more than its low-water mark or is closing, so
+        writes the socket accepts right away do not cost an extra event loop round-trip.
+
+        Args:
+            writer (StreamWriter): The writer used to write data to the TCP connection.
+            queue (asyncio.Queue): The queue of encoded messages, None marks the end.
+            delimiter (bytes): The delimiter written after every message.
+        """
+        get, get_nowait, empty = queue.get, queue.get_nowait, queue.empty
+        writelines, drain = writer.writelines, writer.drain
+        transport = writer.transport
+        get_buffer_size, is_closing = transport.get_write_buffer_size, transport.is_closing
+        low_water = transport.get_write_buffer_limits()[0]
+        done = False
+        while not done:
+            parts = []
+            message = await get()
+            while True:
+                if message is None:
+                    done = True
+                    break
+                parts += (message, delimiter)  # Separate entries, no per-message concatenation
+                if empty() or len(parts) >= 2 * _WS_WRITE_BATCH:
+                    break
+                message = get_nowait()
+            if parts:
+                writelines(parts)
+                if get_buffer_size() > low_water or is_closing():
+                    await drain()
+
+    async def _open_tcp_connection(self):
+        """
+        Opens the connection to the TCP server.
+
+        Returns:
+            tuple[_TCPReaderProtocol, StreamWriter]: The protocol receiving data and the writer sending data.
+        """
+        loop = asyncio.get_running_loop()
+        frames = _FrameBuffer(min(_INITIAL_READ_BUFFER, self.tcp_read_size), self._frame_limit, self.delimiter,
+                              self.tcp_read_size * 2)
+        transport, protocol = await loop.create_connection(
+            lambda: _TCPReaderProtocol(frames, self.tcp_read_size, self._pending_limit, loop),
+            self.tcp_host, self.tcp_port)
+        try:
+            if self.write_high_water is not None or self.write_low_water is not None:
+                transport.set_write_buffer_limits(high=self.write_high_water, low=self.write_low_water)
+        except BaseException:
+            transport.close()  # Do not leak the connection when it cannot be set up
+            raise
+        return protocol, StreamWriter(transport, protocol, None, loop)
+
+    async def _acquire_tcp_connection(self):
+        """
+        Takes an idle connection from the pool, or opens a new one if there is none.
+
+        Returns:
+            tuple[_TCPReaderProtocol, StreamWriter]: The protocol receiving data and the writer sending data.
+        """
+        # Most recently used first, the longer a connection sits idle the likelier the server dropped it
+        while self._pool:
+            reader, writer = self._pool.pop()
+            if reader.is_idle():
+                _log.debug("Reusing pooled TCP connection")
+                return reader, writer
+            await self._close_tcp_connection(writer)
+
+        reader, writer = await self._open_tcp_connection()
+        self._configure_socket(writer.get_extra_info('socket'))
+        return reader, writer
+
+    async def _release_tcp_connection(self, reader: _TCPReaderProtocol, writer: StreamWriter):
+        """
+        Returns a connection to the pool once its session ended, or closes it.
+
+        Args:
+            reader (_TCPReaderProtocol): The protocol receiving data from the TCP connection.
+            writer (StreamWriter): The writer used to write data to the TCP connection.
+        """
+        if self.tcp_pool_size > 0 and reader.is_idle():
+            if self._pool is None:
+                self._pool = collections.deque()
+            if len(self._pool) < self.tcp_pool_size:
+                self._pool.append((reader, writer))
+                return
+        await self._close_tcp_connection(writer)
+
+    @staticmethod
+    async def _close_tcp_connection(writer: StreamWriter):
+        """
+        Closes a TCP connection and waits until it is closed.
+
+        Args:
+            writer (StreamWriter): The writer of the connection.
+        """
+        writer.close()
+        try:
             await writer.wait_closed()
+        except OSError as e:
+            _log.debug("Error while closing TCP connection: %s", e)
+
+    def _configure_socket(self, sock):
+        """
+        Applies the configured buffer sizes and TCP options to a connected socket.
+
+        Args:
+            sock (socket.socket): The socket to configure. Nothing is done if it is None.
+        """
+        if sock is None:
+            return
+        for option, size in ((socket.SO_RCVBUF, self.tcp_rcvbuf), (socket.SO_SNDBUF, self.tcp_sndbuf)):
+            if size and sock.getsockopt(socket.SOL_SOCKET, option) < size:
+                sock.setsockopt(socket.SOL_SOCKET, option, size)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(self.tcp_nodelay))
+        if self.tcp_quickack and hasattr(socket, 'TCP_QUICKACK'):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
 
     async def _handle_ws_connection(self, websocket):
         """
@@ -114,20 +703,75 @@ class TCPWebSocketAdapter:
             websocket (websockets.WebSocketClientProtocol): The WebSocket connection to handle.
         """
         try:
-            logging.info(f"New WebSocket connection established.")
-            reader, writer = await asyncio.open_connection(self.tcp_host, self.tcp_port)
+            _log.info("New WebSocket connection established.")
+            self._configure_socket(websocket.transport.get_extra_info('socket'))
+            reader, writer = await self._acquire_tcp_connection()
 
-            # Start forwarding tasks for both TCP to WS and WS to TCP
-            forward_tcp_task = asyncio.create_task(self._forward_tcp_to_ws(reader, websocket))
-            forward_ws_task = asyncio.create_task(self._forward_ws_to_tcp(websocket, writer))
-            await asyncio.gather(forward_tcp_task, forward_ws_task)
+            # The WebSocket is read by this handler, only TCP to WS forwarding and the TCP writer get tasks
+            queue = asyncio.Queue(maxsize=self.queue_maxsize)
+            tcp_to_ws = asyncio.create_task(self._forward_tcp_to_ws(reader, websocket))
+            tcp_writer = asyncio.create_task(self._write_to_tcp(writer, queue, self.delimiter))
+            forward_tasks = (tcp_to_ws, tcp_writer)
+            handler = asyncio.current_task()
+            state = 'receiving'
+
+            def stop_handler(task):
+                # The first direction to finish tears the other one down instead of leaving it half-open.
+                # While flushing, only the end of the TCP connection stops the handler: the writer finishing
+                # is the flush completing.
+                if state == 'receiving' or (state == 'flushing' and task is tcp_to_ws):
+                    handler.cancel()
+
+            for task in forward_tasks:
+                task.add_done_callback(stop_handler)
+            try:
+                if await self._forward_ws_to_tcp(websocket, queue):
+                    state = 'flushing'
+                    try:
+                        await queue.put(None)  # Let the writer flush what is queued before the connection is released
+                        await tcp_writer
+                    except asyncio.CancelledError:
+                        _log.info("TCP connection closed before the queued messages were written")
+            finally:
+                state = 'stopped'
+                for task in forward_tasks:
+                    task.cancel()
+                await asyncio.gather(*forward_tasks, return_exceptions=True)
+                _log.info("WebSocket connection handler exited")
+                await self._release_tcp_connection(reader, writer)
+            for task in forward_tasks:
+                if not task.cancelled():
+                    task.result()  # Surface unexpected errors from the forwarding tasks
 
         except asyncio.CancelledError:
-            logging.warning("WebSocket connection task cancelled unexpectedly")
+            _log.warning("WebSocket connection task cancelled unexpectedly")
         except Exception as e:
-            logging.error(f"Error in WebSocket connection handling: {e}")
+            _log.error("Error in WebSocket connection handling: %s", e)
         finally:
-            logging.info(f"WebSocket client disconnected")
+            _log.info("WebSocket client disconnected")
+
+    def _ws_serve_options(self):
+        """
+        Builds the keyword arguments passed to websockets.serve from the adapter settings.
+
+        Returns:
+            dict: The keyword arguments.
+        """
+        options = {}
+        if self.ws_read_size is not None:
+            if _LEGACY_WEBSOCKETS:
+                options['read_limit'] = self.ws_read_size
+            else:
+                _log.warning("ws_read_size is only supported by the legacy websockets implementation, ignoring it")
+        high, low = self.write_high_water, self.write_low_water
+        if high is None and low is not None:
+            high = 4 * low  # Same as asyncio's set_write_buffer_limits()
+        if high is not None:
+            if _LEGACY_WEBSOCKETS or low is None:
+                options['write_limit'] = high
+            else:
+                options['write_limit'] = (high, low)
+        return options
 
     async def _ws_server_runner(self):
         """
@@ -135,11 +779,12 @@ class TCPWebSocketAdapter:
         This method will handle incoming WebSocket connections and delegate message forwarding.
         """
         try:
-            self._ws_server = await websockets.serve(self._handle_ws_connection, self.ws_host, self.ws_port)
-            logging.info(f"WebSocket server started at ws://{self.ws_host}:{self.ws_port}")
+            self._ws_server = await websockets.serve(self._handle_ws_connection, self.ws_host, self.ws_port,
+                                                     **self._ws_serve_options())
+            _log.info("WebSocket server started at ws://%s:%s", self.ws_host, self.ws_port)
             await self._ws_server.wait_closed()
         except Exception as e:
-            logging.error(f"Error starting WebSocket server: {e}")
+            _log.error("Error starting WebSocket server: %s", e)
 
     def start(self):
         """
@@ -149,7 +794,7 @@ class TCPWebSocketAdapter:
         """
         if not self._ws_server_runner_task or self._ws_server_runner_task.done():
             self._ws_server_runner_task = asyncio.create_task(self._ws_server_runner())
-            logging.info("Server started successfully.")
+            _log.info("Server started successfully on %s.", type(asyncio.get_running_loop()).__name__)
 
     async def stop(self):
         """
@@ -160,15 +805,19 @@ class TCPWebSocketAdapter:
         if self._ws_server:
             self._ws_server.close()
             await self._ws_server.wait_closed()
-            logging.info("Server stopped gracefully.")
+            _log.info("Server stopped gracefully.")
 
         if self._ws_server_runner_task:
             self._ws_server_runner_task.cancel()
             try:
                 await self._ws_server_runner_task
             except asyncio.CancelledError:
-                logging.info("WebSocket server task was cancelled.")
+                _log.info("WebSocket server task was cancelled.")
+
+        while self._pool:
+            _, writer = self._pool.pop()
+            await self._close_tcp_connection(writer)
 
         self._ws_server = None
         self._ws_server_runner_task = None
-        logging.info("Server resources cleaned up.")
+        _log.info("Server resources cleaned up.")
@@ -1,7 +1,11 @@
 import asyncio
+import contextlib
 import pytest
+import socket
 import websockets
 from tcp_websocket_adapter import TCPWebSocketAdapter
+from tcp_websocket_adapter import tcp_websocket_adapter as adapter_module
+from tcp_websocket_adapter.tcp_websocket_adapter import _FrameBuffer
 
 TCP_HOST = "localhost"
 TCP_PORT = 4242
@@ -30,6 +34,7 @@ async def mock_tcp_server():
             await writer.wait_closed()
 
     server = await asyncio.start_server(handle_client, TCP_HOST, TCP_PORT)
+    server.clients = clients
     yield server
     server.close()
     await server.wait_closed()
@@ -44,6 +49,26 @@ async def bridge():
     await bridge.stop()
 
 
+@contextlib.asynccontextmanager
+async def running_bridge(**kwargs):
+    """Runs a bridge configured with the given keyword arguments."""
+    bridge = TCPWebSocketAdapter(TCP_HOST, TCP_PORT, WS_HOST, WS_PORT, **kwargs)
+    bridge.start()
+    await asyncio.sleep(1)
+    try:
+        yield bridge
+    finally:
+        await bridge.stop()
+
+
+async def wait_for_clients(server, count):
+    """Waits until the mock TCP server has accepted the given number of clients."""
+    async def poll():
+        while len(server.clients) < count:
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), 5)
+
+
 @pytest.mark.asyncio
 async def test_start_stop(bridge):
     """Test if the WebSocket server starts and stops correctly."""
@@ -64,39 +89,405 @@ async def test_client_disconnects(bridge):
     assert bridge._ws_server is not None
 
 
+@pytest.mark.asyncio
+async def test_tcp_close_closes_websocket(bridge):
+    """Test if the WebSocket client is disconnected when the TCP server closes the connection."""
+    async def close_client(reader, writer):
+        writer.close()
+        await writer.wait_closed()
+
+    server = await asyncio.start_server(close_client, TCP_HOST, TCP_PORT)
+    try:
+        async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
+            await asyncio.wait_for(ws.wait_closed(), 5)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
 @pytest.mark.asyncio
 async def test_tcp_to_websocket(mock_tcp_server, bridge):
     """Test if a TCP message is received on the WebSocket."""
     async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
         reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
+        await wait_for_clients(mock_tcp_server, 2)
 
         message = b"Hello from TCP\r\n"
         writer.write(message)
         await writer.drain()
 
-        received = await ws.recv()
+        received = await asyncio.wait_for(ws.recv(), 5)
         assert received == message.strip()
 
         writer.close()
         await writer.wait_closed()
 
 
+@pytest.mark.asyncio
+async def test_tcp_message_split_across_writes(mock_tcp_server, bridge):
+    """Test if TCP frames split across several writes are reassembled before forwarding."""
+    async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
+        reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
+        await wait_for_clients(mock_tcp_server, 2)
+
+        for chunk in (b"Hello ", b"from TCP\r", b"\nSecond\r\n"):
+            writer.write(chunk)
+            await writer.drain()
+            await asyncio.sleep(0.05)
+
+        assert await asyncio.wait_for(ws.recv(), 5) == b"Hello from TCP"
+        assert await asyncio.wait_for(ws.recv(), 5) == b"Second"
+
+        writer.close()
+        await writer.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_oversized_tcp_frame_discarded(mock_tcp_server):
+    """Test if a TCP frame larger than the stream limit is dropped and forwarding continues."""
+    async with running_bridge(tcp_read_size=2):
+        async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
+            reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
+            await wait_for_clients(mock_tcp_server, 2)
+
+            writer.write(b"x" * 300 + b"\r\nafter\r\n")
+            await writer.drain()
+
+            assert await asyncio.wait_for(ws.recv(), 5) == b"after"
+
+            writer.close()
+            await writer.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_tcp_messages_batched(mock_tcp_server):
+    """Test if buffered TCP frames are sent as batched WebSocket messages when batching is enabled."""
+    async with running_bridge(batch_messages=True, batch_max_messages=2):
+        async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
+            reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
+            await wait_for_clients(mock_tcp_server, 2)
+
+            writer.write(b"first\r\nsecond\r\nthird\r\n")
+            await writer.drain()
+
+            assert await asyncio.wait_for(ws.recv(), 5) == b"first\nsecond"
+            assert await asyncio.wait_for(ws.recv(), 5) == b"third"
+
+            writer.close()
+            await writer.wait_closed()
+
+
+def test_buffer_size_alias():
+    """Test if the deprecated buffer_size argument still sets the TCP read size."""
+    adapter = TCPWebSocketAdapter(TCP_HOST, TCP_PORT, WS_HOST, WS_PORT, 2048)
+    assert adapter.tcp_read_size == 2048
+    assert adapter.buffer_size == 2048
+    assert TCPWebSocketAdapter(TCP_HOST, TCP_PORT).buffer_size == 65536
+
+
+
+@pytest.mark.parametrize("delimiter, error", [("\r\n", TypeError), (b"", ValueError)])
+def test_invalid_delimiter(delimiter, error):
+    """Test if a delimiter that is not non-empty bytes is rejected up front."""
+    with pytest.raises(error):
+        TCPWebSocketAdapter(TCP_HOST, TCP_PORT, delimiter=delimiter)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"write_high_water": 1000, "write_low_water": 5000},
+    {"write_high_water": -1},
+    {"write_low_water": -1},
+])
+def test_invalid_write_water_marks(kwargs):
+    """Test if inconsistent write buffer limits are rejected up front."""
+    with pytest.raises(ValueError):
+        TCPWebSocketAdapter(TCP_HOST, TCP_PORT, **kwargs)
+
+
+@pytest.mark.parametrize("legacy, kwargs, expected", [
+    (False, {}, {}),
+    (False, {"write_high_water": 4096}, {"write_limit": 4096}),
+    (False, {"write_high_water": 4096, "write_low_water": 1024}, {"write_limit": (4096, 1024)}),
+    (False, {"write_low_water": 1024}, {"write_limit": (4096, 1024)}),
+    (True, {"write_high_water": 4096, "write_low_water": 1024}, {"write_limit": 4096}),
+    (True, {"write_low_water": 1024}, {"write_limit": 4096}),
+    (True, {"ws_read_size": 1024}, {"read_limit": 1024}),
+])
+def test_ws_serve_options(monkeypatch, legacy, kwargs, expected):
+    """Test if the WebSocket settings are translated for both websockets implementations."""
+    monkeypatch.setattr(adapter_module, "_LEGACY_WEBSOCKETS", legacy)
+    assert TCPWebSocketAdapter(TCP_HOST, TCP_PORT, **kwargs)._ws_serve_options() == expected
+
+
+@pytest.mark.asyncio
+async def test_tcp_write_buffer_limits(mock_tcp_server):
+    """Test if the write water marks are applied to the TCP connection."""
+    adapter = TCPWebSocketAdapter(TCP_HOST, TCP_PORT, write_high_water=4096, write_low_water=1024)
+    _, writer = await adapter._open_tcp_connection()
+    try:
+        assert writer.transport.get_write_buffer_limits() == (1024, 4096)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def test_frame_buffer_splits_frames():
+    """Test if the frame buffer splits, compacts, grows and discards frames fed in small chunks."""
+    frames = _FrameBuffer(4, 10)
+    received = []
+    for byte in b"ab\r\ncdefgh\r\n" + b"x" * 20 + b"\r\nlast\r\ntail":
+        tail = frames.tail()
+        tail[0] = byte
+        received += frames.advance(1)
+
+    assert received == [b"ab", b"cdefgh", b"last"]
+    assert frames.remainder() == b"tail"
+
+
+
+def test_frame_buffer_grows_to_compact_size():
+    """Test if the frame buffer starts small, grows while reads fill it and then compacts instead."""
+    frames = _FrameBuffer(4, 100, compact_size=16)
+    stream = b"abcde\r\n" * 20
+    received = []
+    while stream:
+        tail = frames.tail()
+        chunk, stream = stream[:len(tail)], stream[len(tail):]
+        tail[:len(chunk)] = chunk
+        received += frames.advance(len(chunk))
+
+    assert received == [b"abcde"] * 20
+    assert len(frames._data) == 16
+
+
+@pytest.mark.parametrize("delimiter", [b"\x01", b"END"])
+def test_frame_buffer_custom_delimiter(delimiter):
+    """Test if the frame buffer splits frames on a configured delimiter, also when it straddles reads."""
+    frames = _FrameBuffer(4, 10, delimiter)
+    received = []
+    for byte in b"ab" + delimiter + b"x" * 20 + delimiter + b"last" + delimiter + b"tail":
+        tail = frames.tail()
+        tail[0] = byte
+        received += frames.advance(1)
+
+    assert received == [b"ab", b"last"]
+    assert frames.remainder() == b"tail"
+
+
+@pytest.fixture
+def tcp_socket_pair():
+    """Creates a connected pair of TCP sockets."""
+    with socket.create_server(("127.0.0.1", 0)) as listener:
+        client = socket.create_connection(listener.getsockname())
+        server, _ = listener.accept()
+    yield client, server
+    client.close()
+    server.close()
+
+
+def test_configure_socket(tcp_socket_pair):
+    """Test if socket options are applied and buffer sizes are raised but never lowered."""
+    sock, _ = tcp_socket_pair
+    sndbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+    rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+
+    # Linux doubles the requested size, so lowering to a quarter would still show up as a change
+    TCPWebSocketAdapter(TCP_HOST, TCP_PORT, tcp_rcvbuf=rcvbuf + 4096, tcp_sndbuf=sndbuf // 4)._configure_socket(sock)
+    assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) > rcvbuf
+    assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) == sndbuf
+
+    TCPWebSocketAdapter(TCP_HOST, TCP_PORT, tcp_nodelay=False)._configure_socket(sock)
+    assert not sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+
+
 @pytest.mark.asyncio
 async def test_websocket_to_tcp(mock_tcp_server, bridge):
     """Test if a WebSocket message is received on the TCP server."""
     reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
 
     async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
+        await wait_for_clients(mock_tcp_server, 2)
         message = "Hello from WebSocket"
         await ws.send(message)
 
-        received = await reader.read(len(message) + 2)  # +2 for \r\n
+        received = await asyncio.wait_for(reader.read(len(message) + 2), 5)  # +2 for \r\n
         assert received == message.encode() + b'\r\n'
 
     writer.close()
     await writer.wait_closed()
 
 
+@pytest.mark.asyncio
+async def test_websocket_messages_to_tcp_in_order(mock_tcp_server, bridge):
+    """Test if a burst of WebSocket messages reaches the TCP server complete and in order."""
+    reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
+
+    async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
+        await wait_for_clients(mock_tcp_server, 2)
+        messages = [f"message {i}" for i in range(300)]
+        for message in messages:
+            await ws.send(message)
+
+        expected = b"".join(message.encode() + b"\r\n" for message in messages)
+        received = await asyncio.wait_for(reader.readexactly(len(expected)), 5)
+        assert received == expected
+
+    writer.close()
+    await writer.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_websocket_messages_flushed_on_close(mock_tcp_server, bridge):
+    """Test if WebSocket messages sent right before the client disconnects still reach the TCP server."""
+    reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
+
+    async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
+        await wait_for_clients(mock_tcp_server, 2)
+        messages = [f"message {i}" for i in range(300)]
+        for message in messages:
+            await ws.send(message)
+
+    expected = b"".join(message.encode() + b"\r\n" for message in messages)
+    received = await asyncio.wait_for(reader.readexactly(len(expected)), 5)
+    assert received == expected
+
+    writer.close()
+    await writer.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_custom_delimiter(mock_tcp_server):
+    """Test if a custom delimiter is stripped from TCP frames and appended to WebSocket messages."""
+    async with running_bridge(delimiter=b"\x01"):
+        async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
+            reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
+            await wait_for_clients(mock_tcp_server, 2)
+
+            writer.write(b"from tcp\r\n\x01")
+            await writer.drain()
+            assert await asyncio.wait_for(ws.recv(), 5) == b"from tcp\r\n"
+
+            await ws.send("from ws")
+            assert await asyncio.wait_for(reader.readuntil(b"\x01"), 5) == b"from ws\x01"
+
+            writer.close()
+            await writer.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_connection_runs_two_forwarding_tasks(mock_tcp_server, bridge):
+    """Test if a connection only runs tasks for TCP to WebSocket forwarding and the TCP writer."""
+    async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
+        await wait_for_clients(mock_tcp_server, 1)
+        await ws.send("ping")  # Make sure the handler is past connecting
+        await asyncio.sleep(0.1)
+
+        names = sorted(task.get_coro().__qualname__ for task in asyncio.all_tasks())
+        forwarding = [name for name in names if name.startswith("TCPWebSocketAdapter.")
+                      and name != "TCPWebSocketAdapter._ws_server_runner"]
+        assert forwarding == ["TCPWebSocketAdapter._forward_tcp_to_ws", "TCPWebSocketAdapter._write_to_tcp"]
+
+
+@pytest.mark.asyncio
+async def test_tcp_write_while_reading_paused():
+    """Test if writes to the TCP server still drain while reading from it is paused."""
+    received = asyncio.get_running_loop().create_future()
+
+    async def flood_client(reader, writer):
+        writer.write((b"x" * 1000 + b"\r\n") * 512)
+        received.set_result(await reader.readline())
+        writer.close()
+
+    server = await asyncio.start_server(flood_client, TCP_HOST, TCP_PORT)
+    try:
+        adapter = TCPWebSocketAdapter(TCP_HOST, TCP_PORT, tcp_read_size=1024)
+        protocol, writer = await adapter._open_tcp_connection()
+        await asyncio.sleep(0.5)  # Nobody takes the frames, so reading gets paused
+
+        writer.write(b"Hello from WebSocket\r\n")
+        await asyncio.wait_for(writer.drain(), 5)
+        assert await asyncio.wait_for(received, 5) == b"Hello from WebSocket\r\n"
+
+        writer.close()
+        await writer.wait_closed()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_tcp_connection_reused_from_pool(mock_tcp_server):
+    """Test if a pooled TCP connection is reused by the next WebSocket client."""
+    async with running_bridge(tcp_pool_size=1) as bridge:
+        async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}"):
+            await wait_for_clients(mock_tcp_server, 1)
+        await asyncio.sleep(0.5)
+        assert len(bridge._pool) == 1
+
+        async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws:
+            reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
+            await wait_for_clients(mock_tcp_server, 2)
+            assert not bridge._pool
+
+            await ws.send("Hello again")
+            received = await asyncio.wait_for(reader.readuntil(b"\r\n"), 5)
+            assert received == b"Hello again\r\n"
+
+            writer.close()
+            await writer.wait_closed()
+
+        await asyncio.sleep(0.5)
+        assert len(mock_tcp_server.clients) == 1
+
+    await asyncio.sleep(0.5)
+    assert not mock_tcp_server.clients
+
+
+@pytest.mark.asyncio
+async def test_tcp_writer_waits_for_drain():
+    """Test if the TCP writer still waits in drain() once the write buffer exceeds the high-water mark."""
+    start_reading = asyncio.Event()
+    received = asyncio.Queue()
+
+    async def handle_client(reader, writer):
+        await start_reading.wait()
+        while data := await reader.read(1 << 20):
+            received.put_nowait(len(data))
+        received.put_nowait(None)
+        writer.close()
+
+    server = await asyncio.start_server(handle_client, TCP_HOST, TCP_PORT)
+    adapter = TCPWebSocketAdapter(TCP_HOST, TCP_PORT, write_high_water=4096, write_low_water=1024)
+    protocol, writer = await adapter._open_tcp_connection()
+    queue = asyncio.Queue()
+    message = b"x" * 65534
+    for _ in range(1024):
+        queue.put_nowait(message)
+    queue.put_nowait(None)
+    writer_task = asyncio.create_task(adapter._write_to_tcp(writer, queue, b"\r\n"))
+    try:
+        async def suspended_in_drain():
+            while not protocol._drain_waiters:
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(suspended_in_drain(), 5)
+        assert not writer_task.done()
+        assert not queue.empty()
+
+        start_reading.set()
+        await asyncio.wait_for(writer_task, 10)
+        writer.close()
+        total = 0
+        while (size := await asyncio.wait_for(received.get(), 5)) is not None:
+            total += size
+        assert total == 1024 * 65536
+    finally:
+        writer_task.cancel()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+
 @pytest.mark.asyncio
 async def test_tcp_message_sent_to_multiple_ws_clients(mock_tcp_server, bridge):
     """Test if a TCP message is received and forwarded to multiple WebSocket clients."""
@@ -104,6 +495,7 @@ async def test_tcp_message_sent_to_multiple_ws_clients(mock_tcp_server, bridge):
     async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws1:
         async with websockets.connect(f"ws://{WS_HOST}:{WS_PORT}") as ws2:
             reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
+            await wait_for_clients(mock_tcp_server, 3)
 
             message = b"Hello from TCP\r\n"
             writer.write(message)
@@ -111,8 +503,8 @@ async def test_tcp_message_sent_to_multiple_ws_clients(mock_tcp_server, bridge):
 
             await asyncio.sleep(0.1)
 
-            received_ws1 = await ws1.recv()
-            received_ws2 = await ws2.recv()
+            received_ws1 = await asyncio.wait_for(ws1.recv(), 5)
+            received_ws2 = await asyncio.wait_for(ws2.recv(), 5)
 
             assert received_ws1.strip() == message.strip()
             assert received_ws2.strip() == message.strip()